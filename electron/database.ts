@@ -15,6 +15,46 @@ export interface ExamTableStatus {
   isComplete: boolean; // true if both tables exist
 }
 
+// Columns written by createQuestion, built once at load instead of on every insert
+const QUESTION_INSERT_COLUMNS = [
+  'uuid',
+  'question', 'question_image_url',
+  'option_a', 'option_a_image_url',
+  'option_b', 'option_b_image_url',
+  'option_c', 'option_c_image_url',
+  'option_d', 'option_d_image_url',
+  'answer',
+  'type', 'year',
+  'tag_1', 'tag_2', 'tag_3', 'tag_4',
+  'topic_tags', 'importance_level',
+  'verification_level_1', 'verification_level_2',
+  'jee_mains_relevance', 'is_multi_concept', 'related_concepts',
+  'scary', 'calc',
+  'legacy_question', 'legacy_a', 'legacy_b', 'legacy_c', 'legacy_d', 'legacy_solution',
+  'links',
+  'created_at', 'updated_at', 'frequency'
+];
+const QUESTION_INSERT_COLUMNS_SQL = QUESTION_INSERT_COLUMNS.join(', ');
+const QUESTION_INSERT_PLACEHOLDERS = QUESTION_INSERT_COLUMNS.map(() => '?').join(', ');
+
+// IPQ rows carry the parent exam plus the auto-selection columns
+const IPQ_INSERT_COLUMNS = [...QUESTION_INSERT_COLUMNS, 'parent_exam', 'division_override', 'class'];
+const IPQ_INSERT_SQL = `INSERT INTO ipq_questions(${IPQ_INSERT_COLUMNS.join(', ')}) VALUES(${IPQ_INSERT_COLUMNS.map(() => '?').join(', ')})`;
+
+// Max bound parameters per IN(...) list, well under SQLite's host-parameter limit
+const SQL_IN_CHUNK_SIZE = 500;
+
+/**
+ * Split a list into chunks small enough for a single IN(...) clause
+ */
+function chunkForInClause<T>(items: T[], size: number = SQL_IN_CHUNK_SIZE): T[][] {
+  const chunks: T[][] = [];
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size));
+  }
+  return chunks;
+}
+
 // Cache for available tables to avoid repeated queries
 let cachedTablesInfo: { firstExamWithQuestions?: ExamType } | null = null;
 let cachedDbPath: string | null = null;
@@ -91,15 +131,38 @@ function attachExamSourceToArray<T>(rows: T[], exam?: ExamType, tableName?: stri
 
 export class DatabaseService {
   private db: Database.Database | null = null;
+  // Prepared statements keyed by SQL text, reused for the life of the connection
+  private statementCache = new Map<string, Database.Statement>();
+  // Lower-cased table names in the connected database: read once on connect,
+  // then kept current as schema setup creates tables
+  private tableNames = new Set<string>();
 
   constructor(private dbPath?: string) { }
 
   connect(dbPath?: string): void {
+    // Reconnecting (e.g. picking another file) must not leak the old handle
+    if (this.db) this.disconnect();
+
     const finalPath = dbPath || this.dbPath || path.join(process.cwd(), 'questions.db');
     this.db = new Database(finalPath);
     console.log(`Connected to database at: ${finalPath}`);
 
+    // WAL + NORMAL sync: commits append to the WAL without an fsync each time,
+    // which keeps multi-row writes (frequency updates, migrations) cheap.
+    // Switching to WAL writes to the file, so a read-only database throws here;
+    // log and carry on so it still opens for browsing
+    try {
+      this.db.pragma('journal_mode = WAL');
+    } catch (error) {
+      console.error('[DB] Error enabling WAL journal mode:', error);
+    }
+    // Per-connection settings only, nothing is written to the file
+    this.db.pragma('synchronous = NORMAL');
+    this.db.pragma('temp_store = MEMORY');
+    this.db.pragma('cache_size = -65536'); // 64 MB page cache
+
     // IMPORTANT: Detect tables FIRST so ensureSchema knows which table to use
+    this.refreshTableNames();
     this.detectAvailableTables();
     this.ensureSchema();
     this.createSolutionTable();
@@ -108,23 +171,54 @@ export class DatabaseService {
 
 
   /**
-   * Detect available tables and cache the info for auto-fallback
-   * This allows queries without exam parameter to use available exam tables
+   * Prepare a fixed SQL statement once per connection and reuse it afterwards
+   * Only use for SQL without a variable-length IN(...) list, otherwise the cache grows unbounded
    */
-  private detectAvailableTables(): void {
+  private prepareCached(sql: string): Database.Statement {
+    let stmt = this.statementCache.get(sql);
+    if (!stmt) {
+      stmt = this.db!.prepare(sql);
+      this.statementCache.set(sql, stmt);
+    }
+    return stmt;
+  }
+
+  /**
+   * Reload the set of table names from sqlite_master
+   */
+  private refreshTableNames(): void {
     if (!this.db) return;
 
     try {
       const tables = this.db.prepare(
         "SELECT name FROM sqlite_master WHERE type='table'"
       ).all() as { name: string }[];
+      this.tableNames = new Set(tables.map(t => t.name.toLowerCase()));
+    } catch (error) {
+      console.error('[DB] Error loading table names:', error);
+    }
+  }
+
+  /**
+   * Check a table exists without touching the database
+   * Lets multi-table lookups skip missing tables instead of catching a prepare() error
+   */
+  private hasTable(table: string): boolean {
+    return this.tableNames.has(table.toLowerCase());
+  }
 
-      const tableNames = new Set(tables.map(t => t.name.toLowerCase()));
+  /**
+   * Detect available tables and cache the info for auto-fallback
+   * This allows queries without exam parameter to use available exam tables
+   */
+  private detectAvailableTables(): void {
+    if (!this.db) return;
 
+    try {
       // Find first exam with a questions table
       let firstExamWithQuestions: ExamType | undefined;
       for (const exam of SUPPORTED_EXAMS) {
-        if (tableNames.has(`${exam.toLowerCase()}_questions`)) {
+        if (this.hasTable(`${exam.toLowerCase()}_questions`)) {
           firstExamWithQuestions = exam;
           break;
         }
@@ -155,11 +249,12 @@ export class DatabaseService {
     console.log(`[DB] findQuestionTable: Looking for UUID "${uuid}" (length: ${uuid.length})`);
 
     for (const exam of SUPPORTED_EXAMS) {
-      try {
-        const table = `${exam.toLowerCase()}_questions`;
+      const table = `${exam.toLowerCase()}_questions`;
+      if (!this.hasTable(table)) continue;
 
+      try {
         // Exact match
-        const stmt = this.db.prepare(`SELECT 1 FROM ${table} WHERE uuid = ?`);
+        const stmt = this.prepareCached(`SELECT 1 FROM ${table} WHERE uuid = ?`);
         const result = stmt.get(uuid);
 
         if (result) {
@@ -168,7 +263,7 @@ export class DatabaseService {
         }
 
         // Check for partial match (if UUID is truncated)
-        const likeStmt = this.db.prepare(`SELECT uuid FROM ${table} WHERE uuid LIKE ? LIMIT 1`);
+        const likeStmt = this.prepareCached(`SELECT uuid FROM ${table} WHERE uuid LIKE ? LIMIT 1`);
         const likeResult = likeStmt.get(`%${uuid}%`) as { uuid: string } | undefined;
 
         if (likeResult) {
@@ -179,7 +274,7 @@ export class DatabaseService {
 
         console.log(`[DB] findQuestionTable: ${table} -> not found`);
       } catch (e) {
-        console.log(`[DB] findQuestionTable: ${exam.toLowerCase()}_questions table error`, e);
+        console.log(`[DB] findQuestionTable: ${table} table error`, e);
       }
     }
 
@@ -238,6 +333,12 @@ export class DatabaseService {
             this.db.exec(`ALTER TABLE ${tableName} ADD COLUMN ${colName} ${colDef}`);
           }
         }
+
+        // Chapter lookups (tag_2 = ? / tag_2 IN (...)) back selection, cleaning and
+        // auto-select. Auto-select also filters on class/answer, orders by frequency and
+        // reads only uuid + class, so this index covers its picks without row lookups.
+        // Its leading tag_2 column serves plain chapter lookups too
+        this.db.exec(`CREATE INDEX IF NOT EXISTS idx_${tableName}_chapter_select ON ${tableName}(tag_2, class, frequency, answer, uuid)`);
       } catch (error) {
         console.error(`[DB] Error checking/updating schema for ${tableName}:`, error);
       }
@@ -269,6 +370,7 @@ export class DatabaseService {
     FOREIGN KEY(uuid) REFERENCES questions(uuid) ON DELETE CASCADE
   );
 `);
+      this.tableNames.add('solutions');
       console.log('[DB] Legacy solutions table checked/created');
     } catch (error) {
       console.error('[DB] Error creating legacy solutions table:', error);
@@ -282,16 +384,13 @@ export class DatabaseService {
         const solutionsTable = `${exam}_solutions`;
 
         // Check if the corresponding questions table exists first
-        const tableInfo = this.db.pragma(`table_info(${questionsTable})`) as any[];
-        if (tableInfo.length === 0) {
+        if (!this.hasTable(questionsTable)) {
           // Questions table doesn't exist, skip creating solutions table
           continue;
         }
 
         // Check if solutions table already exists
-        const solutionsTableInfo = this.db.pragma(`table_info(${solutionsTable})`) as any[];
-
-        if (solutionsTableInfo.length > 0) {
+        if (this.hasTable(solutionsTable)) {
           // Table exists - check if FK constraint is correct
           const fkInfo = this.db.pragma(`foreign_key_list(${solutionsTable})`) as any[];
           const hasCorrectFK = fkInfo.some((fk: any) => fk.table === questionsTable);
@@ -299,36 +398,42 @@ export class DatabaseService {
           if (!hasCorrectFK) {
             console.log(`[DB] ${solutionsTable} has incorrect FK, recreating with correct FK to ${questionsTable}...`);
 
-            // Backup existing data
-            const existingData = this.db.prepare(`SELECT * FROM ${solutionsTable}`).all();
-            console.log(`[DB] Backing up ${existingData.length} solutions from ${solutionsTable}`);
-
-            // Drop and recreate with correct FK
-            this.db.exec(`DROP TABLE ${solutionsTable}`);
-            this.db.exec(`
-              CREATE TABLE ${solutionsTable}(
-          uuid TEXT PRIMARY KEY,
-          solution_text TEXT,
-          solution_image_url TEXT,
-          FOREIGN KEY(uuid) REFERENCES ${questionsTable}(uuid) ON DELETE CASCADE
-        );
-      `);
-
-            // Restore data (only for UUIDs that exist in the correct questions table)
-            if (existingData.length > 0) {
-              const insertStmt = this.db.prepare(`
-                INSERT OR IGNORE INTO ${solutionsTable} (uuid, solution_text, solution_image_url)
-                SELECT ?, ?, ?
-                WHERE EXISTS (SELECT 1 FROM ${questionsTable} WHERE uuid = ?)
-              `);
-
-              let restored = 0;
-              for (const row of existingData as any[]) {
-                const result = insertStmt.run(row.uuid, row.solution_text, row.solution_image_url, row.uuid);
-                if (result.changes > 0) restored++;
+            // Backup, drop, recreate and restore in a single transaction so the
+            // restore is one commit and a failure leaves the old table intact
+            const migrate = this.db.transaction(() => {
+              // Backup existing data
+              const existingData = this.db!.prepare(`SELECT * FROM ${solutionsTable}`).all();
+              console.log(`[DB] Backing up ${existingData.length} solutions from ${solutionsTable}`);
+
+              // Drop and recreate with correct FK
+              this.db!.exec(`DROP TABLE ${solutionsTable}`);
+              this.db!.exec(`
+                CREATE TABLE ${solutionsTable}(
+            uuid TEXT PRIMARY KEY,
+            solution_text TEXT,
+            solution_image_url TEXT,
+            FOREIGN KEY(uuid) REFERENCES ${questionsTable}(uuid) ON DELETE CASCADE
+          );
+        `);
+
+              // Restore data (only for UUIDs that exist in the correct questions table)
+              if (existingData.length > 0) {
+                const insertStmt = this.db!.prepare(`
+                  INSERT OR IGNORE INTO ${solutionsTable} (uuid, solution_text, solution_image_url)
+                  SELECT ?, ?, ?
+                  WHERE EXISTS (SELECT 1 FROM ${questionsTable} WHERE uuid = ?)
+                `);
+
+                let restored = 0;
+                for (const row of existingData as any[]) {
+                  const result = insertStmt.run(row.uuid, row.solution_text, row.solution_image_url, row.uuid);
+                  if (result.changes > 0) restored++;
+                }
+                console.log(`[DB] Restored ${restored}/${existingData.length} solutions to ${solutionsTable}`);
               }
-              console.log(`[DB] Restored ${restored}/${existingData.length} solutions to ${solutionsTable}`);
-            }
+            });
+
+            migrate();
 
             console.log(`[DB] ${solutionsTable} recreated with correct FK to ${questionsTable}`);
           } else {
@@ -344,6 +449,7 @@ export class DatabaseService {
         FOREIGN KEY(uuid) REFERENCES ${questionsTable}(uuid) ON DELETE CASCADE
       );
     `);
+          this.tableNames.add(solutionsTable);
           console.log(`[DB] ${solutionsTable} table created`);
         }
       } catch (error) {
@@ -404,8 +510,14 @@ export class DatabaseService {
   class INTEGER
 );
 `);
+      this.tableNames.add('ipq_questions');
       console.log('[DB] IPQ questions table checked/created');
 
+      // Plain tag_2 index for chapter lookups (getQuestionsTable('IPQ')). Unlike the exam
+      // tables this skips the covering chapter-select index from ensureSchema: auto-select
+      // only picks from jee/neet/bits, so IPQ has no class/frequency-ordered picks to cover
+      this.db.exec('CREATE INDEX IF NOT EXISTS idx_ipq_questions_tag_2 ON ipq_questions(tag_2)');
+
       // Create ipq_solutions table
       this.db.exec(`
         CREATE TABLE IF NOT EXISTS ipq_solutions(
@@ -415,6 +527,7 @@ export class DatabaseService {
   FOREIGN KEY(uuid) REFERENCES ipq_questions(uuid) ON DELETE CASCADE
 );
 `);
+      this.tableNames.add('ipq_solutions');
       console.log('[DB] IPQ solutions table checked/created');
     } catch (error) {
       console.error('[DB] Error creating IPQ tables:', error);
@@ -470,6 +583,8 @@ export class DatabaseService {
 
   disconnect(): void {
     if (this.db) {
+      this.statementCache.clear();
+      this.tableNames.clear();
       this.db.close();
       this.db = null;
       console.log('Database connection closed');
@@ -505,21 +620,15 @@ export class DatabaseService {
     }
 
     try {
-      // Get all table names from the database
-      const tables = this.db.prepare(
-        "SELECT name FROM sqlite_master WHERE type='table'"
-      ).all() as { name: string }[];
-
-      const tableNames = new Set(tables.map(t => t.name.toLowerCase()));
-
-      console.log('[DB] Available tables:', Array.from(tableNames));
+      // Table names are tracked on the service, no sqlite_master scan per call
+      console.log('[DB] Available tables:', Array.from(this.tableNames));
 
       return SUPPORTED_EXAMS.map(exam => {
         const questionsTable = `${exam.toLowerCase()}_questions`;
         const solutionsTable = `${exam.toLowerCase()}_solutions`;
 
-        const hasQuestionsTable = tableNames.has(questionsTable);
-        const hasSolutionsTable = tableNames.has(solutionsTable);
+        const hasQuestionsTable = this.hasTable(questionsTable);
+        const hasSolutionsTable = this.hasTable(solutionsTable);
 
         console.log(`[DB] ${exam}: questions = ${hasQuestionsTable}, solutions = ${hasSolutionsTable} `);
 
@@ -591,7 +700,7 @@ export class DatabaseService {
     if (!this.db) throw new Error('Database not connected');
 
     const table = getQuestionsTable(exam);
-    const stmt = this.db.prepare(`SELECT * FROM ${table} WHERE uuid = ? `);
+    const stmt = this.prepareCached(`SELECT * FROM ${table} WHERE uuid = ? `);
     const result = stmt.get(uuid) as Question | undefined;
     return result ? attachExamSource(result, exam, table) : null;
   }
@@ -625,8 +734,10 @@ export class DatabaseService {
     const foundUuids = new Set<string>();
 
     for (const examType of SUPPORTED_EXAMS) {
+      const table = `${examType.toLowerCase()}_questions`;
+      if (!this.hasTable(table)) continue;
+
       try {
-        const table = `${examType.toLowerCase()}_questions`;
         const remainingUuids = uuids.filter(u => !foundUuids.has(u));
         if (remainingUuids.length === 0) break;
 
@@ -638,8 +749,7 @@ export class DatabaseService {
         results.forEach(q => foundUuids.add(q.uuid));
         allResults.push(...attachExamSourceToArray(results, examType, table));
       } catch (e) {
-        // Table might not exist, continue to next
-        console.log(`[DB] getQuestionsByUUIDs: ${examType} table not found, skipping`);
+        console.error(`[DB] getQuestionsByUUIDs: error querying ${table}:`, e);
       }
     }
 
@@ -752,15 +862,22 @@ export class DatabaseService {
   getTags(): string[] {
     if (!this.db) throw new Error('Database not connected');
 
-    const tags = new Set<string>();
+    const table = getQuestionsTable();
 
-    for (let i = 1; i <= 4; i++) {
-      const column = `tag_${i} `;
-      const values = this.getUniqueValues(column);
-      values.forEach(tag => tags.add(tag));
-    }
-
-    return Array.from(tags).sort();
+    // UNION de-duplicates across the four tag columns and ORDER BY sorts,
+    // so SQLite does the whole aggregation in one statement
+    const query = `
+      SELECT tag FROM (
+        SELECT tag_1 AS tag FROM ${table}
+        UNION SELECT tag_2 FROM ${table}
+        UNION SELECT tag_3 FROM ${table}
+        UNION SELECT tag_4 FROM ${table}
+      )
+      WHERE tag IS NOT NULL
+      ORDER BY tag
+    `;
+
+    return this.prepareCached(query).pluck().all() as string[];
   }
 
   /**
@@ -855,7 +972,7 @@ export class DatabaseService {
       if (status.hasQuestionsTable) {
         try {
           const table = `${status.exam.toLowerCase()}_questions`;
-          const stmt = this.db.prepare(`SELECT COUNT(*) as count FROM ${table} `);
+          const stmt = this.prepareCached(`SELECT COUNT(*) as count FROM ${table} `);
           const result = stmt.get() as { count: number };
           breakdown.push({ exam: status.exam, count: result.count });
           total += result.count;
@@ -891,7 +1008,7 @@ export class DatabaseService {
       ORDER BY type, tag_2
   `;
 
-    const rows = this.db.prepare(query).all() as { type: string; tag_2: string }[];
+    const rows = this.prepareCached(query).all() as { type: string; tag_2: string }[];
 
     console.log('[DB] Found', rows.length, 'unique chapter codes in database');
     if (rows.length > 0) {
@@ -936,7 +1053,7 @@ export class DatabaseService {
         }
       }
 
-      const stmt = this.db.prepare(`
+      const stmt = this.prepareCached(`
         UPDATE ${table}
         SET frequency = COALESCE(frequency, 0) + 1,
   updated_at = CURRENT_TIMESTAMP
@@ -1024,7 +1141,7 @@ export class DatabaseService {
         }
       }
 
-      const stmt = this.db.prepare(`
+      const stmt = this.prepareCached(`
         UPDATE ${table}
         SET frequency = MAX(COALESCE(frequency, 0) - 1, 0),
   updated_at = CURRENT_TIMESTAMP
@@ -1258,29 +1375,9 @@ export class DatabaseService {
 
     try {
       const table = getQuestionsTable(exam);
-      const keys = [
-        'uuid',
-        'question', 'question_image_url',
-        'option_a', 'option_a_image_url',
-        'option_b', 'option_b_image_url',
-        'option_c', 'option_c_image_url',
-        'option_d', 'option_d_image_url',
-        'answer',
-        'type', 'year',
-        'tag_1', 'tag_2', 'tag_3', 'tag_4',
-        'topic_tags', 'importance_level',
-        'verification_level_1', 'verification_level_2',
-        'jee_mains_relevance', 'is_multi_concept', 'related_concepts',
-        'scary', 'calc',
-        'legacy_question', 'legacy_a', 'legacy_b', 'legacy_c', 'legacy_d', 'legacy_solution',
-        'links',
-        'created_at', 'updated_at', 'frequency'
-      ];
-
-      const placeholders = keys.map(() => '?').join(', ');
-      const query = `INSERT INTO ${table} (${keys.join(', ')}) VALUES(${placeholders})`;
+      const query = `INSERT INTO ${table} (${QUESTION_INSERT_COLUMNS_SQL}) VALUES(${QUESTION_INSERT_PLACEHOLDERS})`;
 
-      const params = keys.map(key => {
+      const params = QUESTION_INSERT_COLUMNS.map(key => {
         // @ts-ignore
         const value = question[key];
 
@@ -1298,7 +1395,7 @@ export class DatabaseService {
         return value !== undefined ? value : null;
       });
 
-      const stmt = this.db.prepare(query);
+      const stmt = this.prepareCached(query);
       const result = stmt.run(...params);
       console.log(`[DB] Created question ${question.uuid} in ${table}, changes: ${result.changes} `);
       return result.changes > 0;
@@ -1328,7 +1425,7 @@ export class DatabaseService {
       // Fallback: try the passed exam param or default
       const fallbackTable = getSolutionsTable(exam);
       try {
-        const stmt = this.db.prepare(`SELECT * FROM ${fallbackTable} WHERE uuid = ?`);
+        const stmt = this.prepareCached(`SELECT * FROM ${fallbackTable} WHERE uuid = ?`);
         return (stmt.get(uuid) as { uuid: string, solution_text: string, solution_image_url: string }) || null;
       } catch (e) {
         return null;
@@ -1339,7 +1436,7 @@ export class DatabaseService {
     const solutionsTable = `${questionLocation.exam.toLowerCase()}_solutions`;
 
     try {
-      const stmt = this.db.prepare(`SELECT * FROM ${solutionsTable} WHERE uuid = ?`);
+      const stmt = this.prepareCached(`SELECT * FROM ${solutionsTable} WHERE uuid = ?`);
       return (stmt.get(uuid) as { uuid: string, solution_text: string, solution_image_url: string }) || null;
     } catch (error) {
       console.error(`[DB] Error getting solution from ${solutionsTable}:`, error);
@@ -1384,6 +1481,8 @@ export class DatabaseService {
     const placeholders = uuids.map(() => '?').join(',');
 
     for (const table of tables) {
+      if (!this.hasTable(table)) continue;
+
       try {
         const query = `SELECT * FROM ${table} WHERE uuid IN(${placeholders})`;
         const stmt = this.db.prepare(query);
@@ -1395,8 +1494,7 @@ export class DatabaseService {
           }
         }
       } catch (error) {
-        // Table might not exist, skip silently
-        console.log(`[DB] Skipping solutions table ${table} (may not exist)`);
+        console.error(`[DB] Error fetching solutions from ${table}:`, error);
       }
     }
 
@@ -1447,11 +1545,7 @@ export class DatabaseService {
 
       // STEP 3: Ensure the solutions table exists
       try {
-        const tableExists = this.db.prepare(
-          `SELECT name FROM sqlite_master WHERE type='table' AND name=?`
-        ).get(solutionsTable);
-
-        if (!tableExists) {
+        if (!this.hasTable(solutionsTable)) {
           // Determine the questions table for FK reference
           const questionsTableForFK = questionLocation
             ? questionLocation.table
@@ -1466,13 +1560,14 @@ export class DatabaseService {
               FOREIGN KEY(uuid) REFERENCES ${questionsTableForFK}(uuid) ON DELETE CASCADE
             )
           `);
+          this.tableNames.add(solutionsTable);
         }
       } catch (tableError) {
         console.error(`[DB] Error ensuring solutions table exists:`, tableError);
       }
 
       // STEP 4: Insert or update the solution
-      const stmt = this.db.prepare(`
+      const stmt = this.prepareCached(`
         INSERT INTO ${solutionsTable} (uuid, solution_text, solution_image_url)
         VALUES (?, ?, ?)
         ON CONFLICT(uuid) DO UPDATE SET
@@ -1503,32 +1598,7 @@ export class DatabaseService {
     if (!this.db) throw new Error('Database not connected');
 
     try {
-      const keys = [
-        'uuid',
-        'question', 'question_image_url',
-        'option_a', 'option_a_image_url',
-        'option_b', 'option_b_image_url',
-        'option_c', 'option_c_image_url',
-        'option_d', 'option_d_image_url',
-        'answer',
-        'type', 'year',
-        'tag_1', 'tag_2', 'tag_3', 'tag_4',
-        'topic_tags', 'importance_level',
-        'verification_level_1', 'verification_level_2',
-        'jee_mains_relevance', 'is_multi_concept', 'related_concepts',
-        'scary', 'calc',
-        'legacy_question', 'legacy_a', 'legacy_b', 'legacy_c', 'legacy_d', 'legacy_solution',
-        'links',
-        'created_at', 'updated_at', 'frequency',
-        'parent_exam',
-        'division_override',
-        'class'
-      ];
-
-      const placeholders = keys.map(() => '?').join(', ');
-      const query = `INSERT INTO ipq_questions(${keys.join(', ')}) VALUES(${placeholders})`;
-
-      const params = keys.map(key => {
+      const params = IPQ_INSERT_COLUMNS.map(key => {
         if (key === 'parent_exam') return parentExam;
 
         // @ts-ignore
@@ -1547,7 +1617,7 @@ export class DatabaseService {
         return value !== undefined ? value : null;
       });
 
-      const stmt = this.db.prepare(query);
+      const stmt = this.prepareCached(IPQ_INSERT_SQL);
       const result = stmt.run(...params);
       console.log(`[DB] Created IPQ question ${question.uuid} with parent_exam = ${parentExam}, changes: ${result.changes} `);
       return result.changes > 0;
@@ -1572,7 +1642,7 @@ export class DatabaseService {
       console.log('  solutionText:', solutionText ? `"${solutionText.substring(0, 100)}..."` : '(empty)');
       console.log('  solutionImageUrl:', solutionImageUrl || '(empty)');
 
-      const stmt = this.db.prepare(`
+      const stmt = this.prepareCached(`
         INSERT INTO ipq_solutions(uuid, solution_text, solution_image_url)
 VALUES(?, ?, ?)
         ON CONFLICT(uuid) DO UPDATE SET
@@ -1625,7 +1695,7 @@ solution_text = excluded.solution_text,
   getIPQSolution(uuid: string): { uuid: string, solution_text: string, solution_image_url: string } | null {
     if (!this.db) throw new Error('Database not connected');
     try {
-      const stmt = this.db.prepare('SELECT * FROM ipq_solutions WHERE uuid = ?');
+      const stmt = this.prepareCached('SELECT * FROM ipq_solutions WHERE uuid = ?');
       return (stmt.get(uuid) as { uuid: string, solution_text: string, solution_image_url: string }) || null;
     } catch (error) {
       console.error(`[DB] Error getting IPQ solution for ${uuid}: `, error);
@@ -1667,14 +1737,8 @@ solution_text = excluded.solution_text,
     }
 
     try {
-      const tables = this.db.prepare(
-        "SELECT name FROM sqlite_master WHERE type='table'"
-      ).all() as { name: string }[];
-
-      const tableNames = new Set(tables.map(t => t.name.toLowerCase()));
-
-      const hasQuestionsTable = tableNames.has('ipq_questions');
-      const hasSolutionsTable = tableNames.has('ipq_solutions');
+      const hasQuestionsTable = this.hasTable('ipq_questions');
+      const hasSolutionsTable = this.hasTable('ipq_solutions');
 
       return {
         hasQuestionsTable,
@@ -1955,7 +2019,6 @@ solution_text = excluded.solution_text,
         console.log(`[AutoSelect] FINAL TABLE DISTRIBUTION: JEE=${byTable.jee} (target ${jeeCount}), NEET=${byTable.neet} (target ${neetCount}), BITS=${byTable.bits} (target ${bitsCount})`);
         console.log(`[AutoSelect] FINAL CLASS DISTRIBUTION: class1=${byClass.class1} (target ${class1Target}), class2=${byClass.class2} (target ${class2Target}), classNull=${byClass.classNull} (target ${classNullTarget})`);
 
-        allSelectedUuids.push(...sectionSelectedUuids);
         resultSections.push({
           sectionName: section.name,
           sectionType: section.type,
@@ -1970,18 +2033,25 @@ solution_text = excluded.solution_text,
       if (preset.globalRules.incrementFrequencyOnSelect && allSelectedUuids.length > 0) {
         console.log(`[AutoSelect] Incrementing frequency for ${allSelectedUuids.length} questions`);
 
-        // Update in batches per exam table
-        for (const exam of ['JEE', 'NEET', 'BITS'] as const) {
-          const table = `${exam.toLowerCase()}_questions`;
-          try {
-            const updateStmt = this.db.prepare(`UPDATE ${table} SET frequency = COALESCE(frequency, 0) + 1 WHERE uuid = ?`);
-            for (const uuid of allSelectedUuids) {
-              updateStmt.run(uuid);
+        // Update in batches per exam table: one UPDATE ... WHERE uuid IN(...) per chunk
+        // instead of one statement per UUID per table, all inside a single transaction
+        const uuidChunks = chunkForInClause(allSelectedUuids);
+        const incrementAll = this.db.transaction(() => {
+          for (const exam of ['JEE', 'NEET', 'BITS'] as const) {
+            const table = `${exam.toLowerCase()}_questions`;
+            if (!this.hasTable(table)) continue;
+
+            try {
+              for (const uuidChunk of uuidChunks) {
+                const placeholders = uuidChunk.map(() => '?').join(',');
+                this.db!.prepare(`UPDATE ${table} SET frequency = COALESCE(frequency, 0) + 1 WHERE uuid IN(${placeholders})`).run(...uuidChunk);
+              }
+            } catch (e) {
+              console.error(`[AutoSelect] Error incrementing frequency in ${table}:`, e);
             }
-          } catch (e) {
-            // Table might not exist or UUID not in this table - ignore
           }
-        }
+        });
+        incrementAll();
         frequencyUpdated = true;
       }
 
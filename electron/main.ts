@@ -901,47 +901,41 @@ function getUserPresetsDir(): string {
   return path.join(app.getPath('userData'), 'presets');
 }
 
+// Helper to read and parse every preset JSON in a directory concurrently
+async function readPresetsFromDir(dir: string, label: string): Promise<any[]> {
+  if (!fs.existsSync(dir)) return [];
+
+  try {
+    const files = (await fs.promises.readdir(dir)).filter(f => f.endsWith('.json'));
+    // Reads/parses run in parallel; Promise.all keeps directory order for the merge
+    const presets = await Promise.all(files.map(async file => {
+      try {
+        const content = await fs.promises.readFile(path.join(dir, file), 'utf-8');
+        return JSON.parse(content);
+      } catch (e) {
+        console.warn(`[Presets] Failed to load ${label} ${file}:`, e);
+        return null;
+      }
+    }));
+    return presets.filter(preset => preset?.id);
+  } catch (e) {
+    console.warn(`[Presets] Failed to access ${label} directory:`, e);
+    return [];
+  }
+}
+
 // Helper to load all presets from both sources
 async function loadAllPresets(): Promise<Map<string, any>> {
   const presets = new Map<string, any>();
 
-  // 1. Load built-in presets
-  const builtInDir = getBuiltInPresetsDir();
-  if (fs.existsSync(builtInDir)) {
-    try {
-      const files = fs.readdirSync(builtInDir).filter(f => f.endsWith('.json'));
-      for (const file of files) {
-        try {
-          const content = fs.readFileSync(path.join(builtInDir, file), 'utf-8');
-          const preset = JSON.parse(content);
-          if (preset.id) presets.set(preset.id, preset);
-        } catch (e) {
-          console.warn(`[Presets] Failed to load built-in ${file}:`, e);
-        }
-      }
-    } catch (e) {
-      console.warn('[Presets] Failed to access built-in directory:', e);
-    }
-  }
+  const [builtInPresets, userPresets] = await Promise.all([
+    readPresetsFromDir(getBuiltInPresetsDir(), 'built-in'),
+    readPresetsFromDir(getUserPresetsDir(), 'user')
+  ]);
 
-  // 2. Load user presets (override built-in)
-  const userDir = getUserPresetsDir();
-  if (fs.existsSync(userDir)) {
-    try {
-      const files = fs.readdirSync(userDir).filter(f => f.endsWith('.json'));
-      for (const file of files) {
-        try {
-          const content = fs.readFileSync(path.join(userDir, file), 'utf-8');
-          const preset = JSON.parse(content);
-          if (preset.id) presets.set(preset.id, preset);
-        } catch (e) {
-          console.warn(`[Presets] Failed to load user ${file}:`, e);
-        }
-      }
-    } catch (e) {
-      console.warn('[Presets] Failed to access user directory:', e);
-    }
-  }
+  // 1. Built-in presets, 2. user presets (override built-in)
+  for (const preset of builtInPresets) presets.set(preset.id, preset);
+  for (const preset of userPresets) presets.set(preset.id, preset);
 
   return presets;
 }
@@ -60,6 +60,25 @@ export const DEFAULT_FILTERS: FilterState = {
 
 const STORAGE_KEY = 'prepAIred_filter_preferences';
 
+// Answers that mark a Division 1 (MCQ) question
+const MCQ_ANSWERS = new Set(['A', 'B', 'C', 'D']);
+
+// Lower-cased question + options text per question object, filled lazily while searching.
+// Edits replace only the edited objects, so unchanged questions keep their cached key.
+const searchKeys = new WeakMap<Question, string>();
+
+const getSearchKey = (q: Question): string => {
+    let key = searchKeys.get(q);
+    if (key === undefined) {
+        // Fields are joined with NUL, so a match can never straddle two fields
+        key = [q.question, q.option_a, q.option_b, q.option_c, q.option_d]
+            .map(text => (text || '').toLowerCase())
+            .join('\u0000');
+        searchKeys.set(q, key);
+    }
+    return key;
+};
+
 // ==========================================
 // Hook
 // ==========================================
@@ -125,12 +144,18 @@ export const useQuestionFilters = (
     const isNumericalAnswer = (question: Question): boolean => {
         if (question.division_override === 1) return false;
         if (question.division_override === 2) return true;
-        return !['A', 'B', 'C', 'D'].includes(question.answer?.toUpperCase().trim() || '');
+        return !MCQ_ANSWERS.has(question.answer?.toUpperCase().trim() || '');
     };
 
 
     // 4. Filtering Logic (Memoized)
     const filteredQuestions = useMemo(() => {
+        // Lower-case the filter inputs once per run, not once per question
+        const searchLower = filters.searchText.toLowerCase();
+        const searchUuidLower = filters.searchUuid.toLowerCase();
+        const tag1Lower = filters.tag1.toLowerCase();
+        const tag4Lower = filters.tag4.toLowerCase();
+
         return initialQuestions.filter(q => {
             // --- Basic Metadata ---
             if (filters.chapter !== 'all' && q.tag_2 !== filters.chapter) return false;
@@ -166,21 +191,15 @@ export const useQuestionFilters = (
             if (filters.verificationLevel2 !== 'all' && (q.verification_level_2 || 'pending') !== filters.verificationLevel2) return false;
 
             // --- Search ---
-            if (filters.searchText) {
-                const searchLower = filters.searchText.toLowerCase();
-                const contentMatch = (q.question || '').toLowerCase().includes(searchLower) ||
-                    (q.option_a || '').toLowerCase().includes(searchLower) ||
-                    (q.option_b || '').toLowerCase().includes(searchLower) ||
-                    (q.option_c || '').toLowerCase().includes(searchLower) ||
-                    (q.option_d || '').toLowerCase().includes(searchLower);
-                if (!contentMatch) return false;
+            if (searchLower) {
+                if (!getSearchKey(q).includes(searchLower)) return false;
             }
 
-            if (filters.searchUuid && !q.uuid.toLowerCase().includes(filters.searchUuid.toLowerCase())) return false;
+            if (searchUuidLower && !q.uuid.toLowerCase().includes(searchUuidLower)) return false;
 
             // --- Tags ---
-            if (filters.tag1 && !q.tag_1?.toLowerCase().includes(filters.tag1.toLowerCase())) return false;
-            if (filters.tag4 && !q.tag_4?.toLowerCase().includes(filters.tag4.toLowerCase())) return false;
+            if (tag1Lower && !q.tag_1?.toLowerCase().includes(tag1Lower)) return false;
+            if (tag4Lower && !q.tag_4?.toLowerCase().includes(tag4Lower)) return false;
 
 
             return true;